@@ -101,7 +101,7 @@ class ExternalEventProcessor:
                     ),
                     "wb",
                 ) as p:
-                    p.write(png.tobytes())
+                    p.write(png)
 
         # write jpg snapshot with optional annotations
         if draw.get("boxes") and isinstance(draw.get("boxes"), list):
@@ -128,7 +128,7 @@ class ExternalEventProcessor:
             os.path.join(CLIPS_DIR, f"{camera_config.name}-{event_id}.jpg"),
             "wb",
         ) as j:
-            j.write(jpg.tobytes())
+            j.write(jpg)
 
         # create thumbnail with max height of 175 and save
         width = int(175 * img_frame.shape[1] / img_frame.shape[0])
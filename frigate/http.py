@@ -54,6 +54,7 @@ from frigate.util.builtin import (
     get_tz_modifiers,
     update_yaml_from_url,
 )
+from frigate.util.image import yuv_resize
 from frigate.util.services import ffprobe_stream, restart_frigate, vainfo_hwaccel
 from frigate.version import VERSION
 
@@ -1459,15 +1460,26 @@ def latest_frame(camera_name):
         response.headers["Cache-Control"] = "no-store"
         return response
     elif camera_name == "birdseye" and current_app.frigate_config.birdseye.restream:
-        frame = cv2.cvtColor(
-            current_app.detected_frames_processor.get_current_frame(camera_name),
-            cv2.COLOR_YUV2BGR_I420,
-        )
+        frame = current_app.detected_frames_processor.get_current_frame(camera_name)
+        frame_height = frame.shape[0] // 3 * 2
 
-        height = int(request.args.get("h", str(frame.shape[0])))
-        width = int(height * frame.shape[1] / frame.shape[0])
+        height = int(request.args.get("h", str(frame_height)))
+        width = int(height * frame.shape[1] / frame_height)
 
-        frame = cv2.resize(frame, dsize=(width, height), interpolation=cv2.INTER_AREA)
+        if height < 1 or width < 1:
+            return (
+                "Invalid height / width requested :: {} / {}".format(height, width),
+                400,
+            )
+
+        # resize the yuv planes first so only the output size is converted to bgr
+        frame = cv2.cvtColor(yuv_resize(frame, width, height), cv2.COLOR_YUV2BGR_I420)
+
+        # yuv_resize rounds odd sizes up to even, so scale to the exact size requested
+        if frame.shape[0] != height or frame.shape[1] != width:
+            frame = cv2.resize(
+                frame, dsize=(width, height), interpolation=cv2.INTER_AREA
+            )
 
         ret, jpg = cv2.imencode(
             ".jpg", frame, [int(cv2.IMWRITE_JPEG_QUALITY), resize_quality]
@@ -34,6 +34,7 @@ class ImprovedMotionDetector(MotionDetector):
             config.frame_height * frame_shape[1] // frame_shape[0],
         )
         self.avg_frame = np.zeros(self.motion_frame_size, np.float32)
+        self.resized_frame = np.empty(self.motion_frame_size, np.uint8)
         self.motion_frame_count = 0
         self.frame_counter = 0
         resized_mask = cv2.resize(
@@ -61,10 +62,11 @@ class ImprovedMotionDetector(MotionDetector):
 
         gray = frame[0 : self.frame_shape[0], 0 : self.frame_shape[1]]
 
-        # resize frame
+        # resize frame into a reused buffer to avoid an allocation per frame
         resized_frame = cv2.resize(
             gray,
             dsize=(self.motion_frame_size[1], self.motion_frame_size[0]),
+            dst=self.resized_frame,
             interpolation=self.interpolation,
         )
 
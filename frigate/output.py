@@ -133,6 +133,8 @@ class FFMpegConverter(threading.Thread):
 
         ffmpeg_cmd = [
             "ffmpeg",
+            "-filter_threads",
+            "1",
             "-f",
             "rawvideo",
             "-pix_fmt",
@@ -151,6 +153,8 @@ class FFMpegConverter(threading.Thread):
             f"{quality}",
             "-bf",
             "0",
+            "-threads",
+            "2",
             "pipe:",
         ]
 
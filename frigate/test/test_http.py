@@ -3,8 +3,10 @@ import json
 import logging
 import os
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+import cv2
+import numpy as np
 from peewee_migrate import Router
 from playhouse.shortcuts import model_to_dict
 from playhouse.sqlite_ext import SqliteExtDatabase
@@ -388,6 +390,48 @@ class TestHttp(unittest.TestCase):
             stats = client.get("/stats").json
             assert stats == self.test_stats
 
+    def test_birdseye_latest_frame_size(self):
+        # 562 is a valid birdseye height that is not a multiple of 4
+        for canvas_width, canvas_height, sizes in [
+            (1280, 720, [(175, 311), (270, 480), (720, 1280), (1, 1)]),
+            (1000, 562, [(175, 311), (281, 500), (562, 1000), (1, 1)]),
+        ]:
+            config = {
+                **self.minimal_config,
+                "birdseye": {
+                    "restream": True,
+                    "width": canvas_width,
+                    "height": canvas_height,
+                },
+            }
+            frames_processor = MagicMock()
+            frames_processor.get_current_frame.return_value = np.full(
+                (canvas_height * 3 // 2, canvas_width), 128, np.uint8
+            )
+            app = create_app(
+                FrigateConfig(**config),
+                self.db,
+                None,
+                frames_processor,
+                None,
+                None,
+                None,
+                PlusApi(),
+            )
+
+            with app.test_client() as client:
+                for height, width in sizes:
+                    response = client.get(
+                        "/birdseye/latest.jpg", query_string={"h": height}
+                    )
+                    assert response.status_code == 200
+                    frame = cv2.imdecode(
+                        np.frombuffer(response.data, np.uint8), cv2.IMREAD_COLOR
+                    )
+                    assert frame.shape[0:2] == (height, width)
+
+                response = client.get("/birdseye/latest.jpg", query_string={"h": 0})
+                assert response.status_code == 400
 
 def _insert_mock_event(
     id: str,
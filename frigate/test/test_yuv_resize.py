@@ -0,0 +1,54 @@
+from unittest import TestCase, main
+
+import cv2
+import numpy as np
+
+from frigate.util.image import yuv_resize
+
+
+class TestYuvResize(TestCase):
+    def setUp(self):
+        self.bgr_frame = np.zeros((400, 800, 3), np.uint8)
+        self.bgr_frame[:] = (0, 0, 255)
+        self.bgr_frame[:, 400:] = (255, 0, 0)
+        self.yuv_frame = cv2.cvtColor(self.bgr_frame, cv2.COLOR_BGR2YUV_I420)
+
+    def test_resize_shape(self):
+        resized = yuv_resize(self.yuv_frame, 200, 100)
+        assert resized.shape == (150, 200)
+
+    def test_resize_rounds_up_to_valid_shape(self):
+        resized = yuv_resize(self.yuv_frame, 201, 101)
+        assert resized.shape == (153, 202)
+
+    def test_resize_keeps_even_shape(self):
+        resized = yuv_resize(self.yuv_frame, 200, 102)
+        assert resized.shape == (153, 200)
+
+    def test_resize_small_shape(self):
+        resized = yuv_resize(self.yuv_frame, 1, 1)
+        assert resized.shape == (3, 2)
+
+    def test_resize_source_height_not_multiple_of_4(self):
+        bgr_frame = np.zeros((562, 1000, 3), np.uint8)
+        bgr_frame[:] = (0, 0, 255)
+        yuv_frame = cv2.cvtColor(bgr_frame, cv2.COLOR_BGR2YUV_I420)
+        resized = cv2.cvtColor(yuv_resize(yuv_frame, 500, 282), cv2.COLOR_YUV2BGR_I420)
+        assert resized.shape == (282, 500, 3)
+        assert resized[141, 250][2] > 200 and resized[141, 250][0] < 50
+
+    def test_resize_invalid_source_shape(self):
+        with self.assertRaises(ValueError):
+            yuv_resize(self.yuv_frame[0:598], 200, 100)
+
+    def test_resize_keeps_colors(self):
+        resized = cv2.cvtColor(
+            yuv_resize(self.yuv_frame, 200, 100), cv2.COLOR_YUV2BGR_I420
+        )
+        # left half should stay red and right half blue
+        assert resized[50, 50][2] > 200 and resized[50, 50][0] < 50
+        assert resized[50, 150][0] > 200 and resized[50, 150][2] < 50
+
+
+if __name__ == "__main__":
+    main(verbosity=2)
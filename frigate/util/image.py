@@ -531,6 +531,54 @@ def yuv_region_2_bgr(frame, region):
         raise
 
 
+def yuv_resize(frame, width: int, height: int, interpolation=cv2.INTER_AREA):
+    """Resize an I420 frame plane by plane and return the resized I420 frame.
+
+    The source frame height and width must be even. The requested size is rounded
+    up to the nearest even width and height, which is the size of the returned frame.
+    """
+    if frame.shape[0] % 3 != 0 or frame.shape[1] % 2 != 0:
+        raise ValueError(
+            f"I420 frame of shape {frame.shape} does not have an even height and width"
+        )
+
+    height = -(-height // 2) * 2
+    width = -(-width // 2) * 2
+
+    frame_height = frame.shape[0] // 3 * 2
+    frame_width = frame.shape[1]
+    y_size = frame_height * frame_width
+    uv_size = y_size // 4
+
+    resized = np.empty((height * 3 // 2, width), np.uint8)
+    resized_y_size = height * width
+    resized_uv_size = resized_y_size // 4
+
+    # the u and v planes are packed after y, so address them by offset
+    # rather than by row to support heights that are not a multiple of 4
+    src = frame.reshape(-1)
+    dst = resized.reshape(-1)
+    dst[0:resized_y_size] = cv2.resize(
+        src[0:y_size].reshape((frame_height, frame_width)),
+        dsize=(width, height),
+        interpolation=interpolation,
+    ).reshape(-1)
+
+    # resize u and v
+    for i in range(2):
+        src_start = y_size + i * uv_size
+        dst_start = resized_y_size + i * resized_uv_size
+        dst[dst_start : dst_start + resized_uv_size] = cv2.resize(
+            src[src_start : src_start + uv_size].reshape(
+                (frame_height // 2, frame_width // 2)
+            ),
+            dsize=(width // 2, height // 2),
+            interpolation=interpolation,
+        ).reshape(-1)
+
+    return resized
+
+
 def intersection(box_a, box_b) -> Optional[list[int]]:
     """Return intersection box or None if boxes do not intersect."""
     if (